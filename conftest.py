@@ -13,16 +13,32 @@ adds the following options to pytest
     more precisely, only estimators whose class is in a module
     that has changed compared to the main branch
     "off" = runs tests for all estimators
+--numba_jit : str, "auto", "True" or "False", default "auto"
+    turns on/off numba just-in-time compilation, via the NUMBA_DISABLE_JIT env variable
+    "auto" turns off jit compilation if and only if coverage is measured,
+    in that case, numba compiled code would not be traced by coverage anyway
+    an explicitly set NUMBA_DISABLE_JIT env variable always takes precedence
 
-by default, all options are off, including for default local runs of pytest
+the numba on-disk cache for kernels with cache=True is placed in the stable directory
+[tempdir]/sktime_numba_cache, unless the NUMBA_CACHE_DIR env variable is set,
+so compiled kernels are reused between runs; CI can cache this directory between jobs
+
+by default, matrixdesign and only_changed_modules are off,
+including for default local runs of pytest
 if multiple options are turned on, they are combined with AND,
 i.e., intersection of estimators satisfying the conditions
+
+if pytest-xdist is active, tests parametrized by estimator_class or
+estimator_instance are grouped by estimator via the xdist_group marker,
+so with --dist loadgroup all tests of one estimator run on the same worker
 """
 
 # copyright: sktime developers, BSD-3-Clause License (see LICENSE file)
 
 __author__ = ["fkiraly"]
 
+import pytest
+
 
 def pytest_addoption(parser):
     """Pytest command line parser options adder."""
@@ -36,13 +52,97 @@ def pytest_addoption(parser):
         default=False,
         help="test only estimators from modules that have changed compared to main",
     )
+    parser.addoption(
+        "--numba_jit",
+        default="auto",
+        help="turn numba jit on (True) or off (False), auto = off iff coverage is run",
+    )
 
 
 def pytest_configure(config):
     """Pytest configuration preamble."""
+    # numba reads its env variables on import, so these are set before sktime imports
+    _configure_numba_jit(config)
+    _configure_numba_cache()
+    _reload_numba_config()
+
     from sktime.tests import _config
 
     if config.getoption("--matrixdesign") in [True, "True"]:
         _config.MATRIXDESIGN = True
     if config.getoption("--only_changed_modules") in [True, "True"]:
         _config.ONLY_CHANGED_MODULES = True
+
+
+def _configure_numba_jit(config):
+    """Set NUMBA_DISABLE_JIT env variable according to --numba_jit option."""
+    import os
+
+    numba_jit = str(config.getoption("--numba_jit"))
+    if numba_jit == "auto":
+        is_coverage_run = bool(os.environ.get("COVERAGE_RUN")) or bool(
+            config.getoption("cov_source", None)
+        )
+        disable_jit = is_coverage_run
+    else:
+        disable_jit = numba_jit == "False"
+
+    if not disable_jit:
+        return
+
+    os.environ.setdefault("NUMBA_DISABLE_JIT", "1")
+
+
+def _configure_numba_cache():
+    """Set NUMBA_CACHE_DIR env variable to a stable directory, if not set."""
+    import os
+    from tempfile import gettempdir
+
+    cache_dir = os.path.join(gettempdir(), "sktime_numba_cache")
+    os.environ.setdefault("NUMBA_CACHE_DIR", cache_dir)
+
+
+def _reload_numba_config():
+    """Reload numba config from env variables, if numba was already imported.
+
+    numba may have been imported before pytest_configure, e.g., by another plugin,
+    in that case the env variables set above only take effect after a reload.
+    """
+    import sys
+
+    if "numba" in sys.modules:
+        from numba.core.config import reload_config
+
+        reload_config()
+
+
+def _get_estimator_group_name(item):
+    """Return name of estimator parametrizing test item, or None if not found."""
+    from inspect import isclass
+
+    callspec = getattr(item, "callspec", None)
+    if callspec is None:
+        return None
+
+    for fixture_name in ["estimator_class", "estimator_instance"]:
+        if fixture_name in callspec.params:
+            est = callspec.params[fixture_name]
+            if not isclass(est):
+                est = type(est)
+            return est.__name__
+
+    return None
+
+
+# tryfirst, since the xdist worker plugin reads xdist_group markers
+#   in its own pytest_collection_modifyitems, which would otherwise run first
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """Pytest hook to group estimator tests for distribution by pytest-xdist."""
+    if not config.pluginmanager.hasplugin("xdist"):
+        return
+
+    for item in items:
+        group_name = _get_estimator_group_name(item)
+        if group_name is not None:
+            item.add_marker(pytest.mark.xdist_group(name=group_name))
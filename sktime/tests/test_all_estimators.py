@@ -10,6 +10,7 @@ import numbers
 import os
 import types
 from copy import deepcopy
+from functools import lru_cache
 from inspect import getfullargspec, isclass, signature
 from tempfile import TemporaryDirectory
 
@@ -17,20 +18,12 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from sktime.base import BaseEstimator, BaseObject, load
-from sktime.classification.deep_learning.base import BaseDeepClassifier
-from sktime.dists_kernels.base import (
-    BasePairwiseTransformer,
-    BasePairwiseTransformerPanel,
-)
+from sktime.base import BaseEstimator, BaseObject
 from sktime.exceptions import NotFittedError
-from sktime.forecasting.base import BaseForecaster
 from sktime.registry import all_estimators, get_base_class_lookup, scitype
-from sktime.regression.deep_learning.base import BaseDeepRegressor
 from sktime.tests._config import (
     EXCLUDE_ESTIMATORS,
     EXCLUDED_TESTS,
-    MATRIXDESIGN,
     NON_STATE_CHANGING_METHODS,
     NON_STATE_CHANGING_METHODS_ARRAYLIKE,
     VALID_ESTIMATOR_TAGS,
@@ -50,7 +43,13 @@ from sktime.utils._testing.scenarios_getter import retrieve_scenarios
 from sktime.utils.deep_equals import deep_equals
 from sktime.utils.dependencies import _check_soft_dependencies
 from sktime.utils.random_state import set_random_state
-from sktime.utils.sampling import random_partition
+
+# frozenset of VALID_ESTIMATOR_TAGS, for fast membership and set difference checks
+_VALID_ESTIMATOR_TAGS_SET = frozenset(VALID_ESTIMATOR_TAGS)
+
+# soft dependency availability, checked once per session instead of per test
+_SKPRO_AVAILABLE = _check_soft_dependencies("skpro", severity="none")
+_H5PY_AVAILABLE = _check_soft_dependencies("h5py", severity="none")
 
 
 def subsample_by_version_os(x):
@@ -76,13 +75,360 @@ def subsample_by_version_os(x):
         raise ValueError(f"found unexpected OS string: {os_str}")
     ix = ix % 3
 
-    part = random_partition(len(x), 3)
-    subset_idx = part[ix]
+    # fixed seed, so the partition is identical across runs and pytest-xdist workers
+    rng = np.random.default_rng(42)
+    subset_idx = rng.permutation(len(x))[ix::3]
     res = [x[i] for i in subset_idx]
 
     return res
 
 
+@lru_cache
+def _all_estimators_cached(
+    estimator_type_filter, matrixdesign=False, only_changed_modules=False
+):
+    """Retrieve tuple of all estimator classes to test - cached.
+
+    Parameters
+    ----------
+    estimator_type_filter : None, str, or tuple of str
+        scitype(s) of estimators to retrieve, passed to all_estimators
+    matrixdesign : bool, optional, default=False
+        whether to subsample estimators by OS and python version.
+        Value of the MATRIXDESIGN flag, part of the cache key.
+    only_changed_modules : bool, optional, default=False
+        value of the ONLY_CHANGED_MODULES flag used in run_test_for_class,
+        not used in the function body, but part of the cache key.
+
+    Returns
+    -------
+    tuple of classes : estimator classes to test, after exclusions and subsampling
+    """
+    # TODO(fangelim): refactor this _all_estimators
+    # to make it possible to set custom tags to filter
+    # as class attributes, similar to `estimator_type_filter`
+    filter_tags = {"tests:skip_all": False}
+
+    if isinstance(estimator_type_filter, tuple):
+        estimator_type_filter = list(estimator_type_filter)
+
+    est_list = all_estimators(
+        estimator_types=estimator_type_filter,
+        return_names=False,
+        exclude_estimators=EXCLUDE_ESTIMATORS,
+        filter_tags=filter_tags,
+    )
+    # subsample estimators by OS & python version
+    # this ensures that only a 1/3 of estimators are tested for a given combination
+    # but all are tested on every OS at least once, and on every python version once
+    if matrixdesign:
+        est_list = subsample_by_version_os(est_list)
+
+    # run_test_for_class selects the estimators to run
+    # based on whether they have changed, and whether they have all dependencies
+    # internally, uses the ONLY_CHANGED_MODULES flag,
+    # and checks the python env against python_dependencies tag
+    est_list = [est for est in est_list if run_test_for_class(est)]
+
+    return tuple(est_list)
+
+
+@lru_cache
+def _excluded_tests_cached(est):
+    """Get frozenset of names of tests excluded for class est - cached.
+
+    There are two sources for exclusion:
+
+    1. the estimator is excluded in the legacy EXCLUDED_TESTS list
+    2. the excluded test appears in the "tests:skip_by_name" tag
+    """
+
+    def _coerce_to_list(obj):
+        if obj is None:
+            return []
+        if isinstance(obj, str):
+            return [obj]
+        return obj
+
+    excl_list = _coerce_to_list(EXCLUDED_TESTS.get(est.__name__, []))
+    excl_tag = _coerce_to_list(est.get_class_tag("tests:skip_by_name", []))
+    return frozenset(excl_list).union(excl_tag)
+
+
+@lru_cache
+def _create_test_instances_cached(est):
+    """Create test instances and names of class est as tuples - cached.
+
+    Returns
+    -------
+    instances : tuple of instances of est, from est.create_test_instances_and_names
+    names : tuple of str, names of instances, same length as instances
+    """
+    instances, names = est.create_test_instances_and_names()
+    return tuple(instances), tuple(names)
+
+
+@lru_cache
+def _retrieve_scenario_classes_cached(obj_scitype):
+    """Retrieve tuple of enabled test scenario classes for scitype obj_scitype - cached.
+
+    Scenarios are not filtered for applicability to any specific object.
+    Only classes are cached, scenario instances hold the test data,
+    so they are constructed anew by the caller, to avoid side effects between tests.
+    """
+    # this line excludes all scenarios that do not have "is_enabled" flag
+    #   we should slowly enable more scenarios for better coverage
+    # set filter_tags to None to run the full test suite with new scenarios
+    filter_tags = {"is_enabled": True}
+    scenarios = retrieve_scenarios(obj_scitype, filter_tags=filter_tags)
+    return tuple(type(scen) for scen in scenarios)
+
+
+@lru_cache
+def _get_test_params_cached(cls):
+    """Return cls.get_test_params() - cached.
+
+    Return is shared between callers, and must be copied before passing its values
+    to a constructor or set_params, or otherwise mutating it.
+    """
+    return cls.get_test_params()
+
+
+@lru_cache
+def _get_param_names_cached(cls):
+    """Return cls.get_param_names() as tuple - cached."""
+    return tuple(cls.get_param_names())
+
+
+@lru_cache
+def _get_param_defaults_cached(cls):
+    """Return cls.get_param_defaults() - cached.
+
+    Return is shared between callers, and must be copied before mutating it.
+    """
+    return cls.get_param_defaults()
+
+
+@lru_cache
+def _reserved_params_cached(cls):
+    """Return reserved parameter names of class cls, as frozenset of str - cached.
+
+    Coerces the "reserved_params" tag of cls, which can be None, str, or list of str.
+    """
+    reserved_params = cls.get_class_tag("reserved_params", tag_value_default=None)
+    if reserved_params is None:
+        return frozenset()
+    if isinstance(reserved_params, str):
+        return frozenset([reserved_params])
+    return frozenset(reserved_params)
+
+
+@lru_cache
+def _unreserved_param_names_cached(cls):
+    """Return parameter names of class cls that are not reserved, frozenset - cached."""
+    return frozenset(_get_param_names_cached(cls)) - _reserved_params_cached(cls)
+
+
+@lru_cache
+def _init_signature_cached(cls):
+    """Return signature information of cls.__init__ - cached.
+
+    Returns
+    -------
+    varkw : str or None, name of the ``**`` argument of cls.__init__, if any
+    init_args : tuple of str, from _get_args(cls.__init__), includes self
+    init_params : tuple of inspect.Parameter, hyper-parameters of cls.__init__,
+        i.e., parameters of signature of bound __init__, except ``*`` and ``**``
+    """
+    init = cls.__init__
+    varkw = getfullargspec(init).varkw
+    init_args = tuple(_get_args(init))
+
+    # first parameter is dropped, as in the signature of the bound method
+    bound_params = list(signature(init).parameters.values())[1:]
+    init_params = tuple(
+        p
+        for p in bound_params
+        if p.name != "self" and p.kind not in [p.VAR_KEYWORD, p.VAR_POSITIONAL]
+    )
+    return varkw, init_args, init_params
+
+
+@lru_cache
+def _joblib_hash():
+    """Return joblib.hash if joblib is installed, otherwise None - cached."""
+    if not _check_soft_dependencies("joblib", severity="none"):
+        return None
+
+    from joblib import hash
+
+    return hash
+
+
+# types for which == with same type is equivalent to deep_equals, in _fast_dict_equal
+_FAST_EQUAL_TYPES = (str, int, float, bool, type(None))
+
+
+def _fast_equal(x, y):
+    """Check whether x and y are equal, using cheap comparisons only.
+
+    Returns True only if x and y are identical,
+    or of the same primitive type in _FAST_EQUAL_TYPES and equal.
+    If True, deep_equals(x, y) is also True.
+    If False, x and y may still be equal, and deep_equals should be used to check.
+    """
+    if x is y:
+        return True
+    return type(x) is type(y) and type(x) in _FAST_EQUAL_TYPES and x == y
+
+
+def _fast_dict_equal(x, y):
+    """Check whether dicts x and y are equal, using cheap comparisons only.
+
+    Returns True only if x and y have the same keys, and _fast_equal is True
+    for the values under each key.
+    If True, deep_equals(x, y) is also True.
+    If False, x and y may still be equal, and deep_equals should be used to check.
+    """
+    if x.keys() != y.keys():
+        return False
+    return all(_fast_equal(x_value, y[key]) for key, x_value in x.items())
+
+
+@lru_cache
+def _allowed_param_types_cached():
+    """Return frozenset of types allowed for __init__ defaults - cached.
+
+    Used in test_constructor, contains joblib Memory if joblib is installed.
+    """
+    allowed_param_types = [
+        str,
+        int,
+        float,
+        bool,
+        tuple,
+        type(None),
+        np.float64,
+        types.FunctionType,
+    ]
+    if _check_soft_dependencies("joblib", severity="none"):
+        from joblib import Memory
+
+        allowed_param_types += [Memory]
+
+    return frozenset(allowed_param_types)
+
+
+def _has_dynamic_tags(obj):
+    """Check whether obj is an instance with tags set dynamically, e.g., in __init__.
+
+    If False, tags of obj are equal to the class tags of obj, or type(obj).
+    """
+    return not isclass(obj) and bool(getattr(obj, "_tags_dynamic", None))
+
+
+@lru_cache
+def _scitype_cached(obj_cls):
+    """Determine scitype string of class obj_cls - cached."""
+    return scitype(obj_cls)
+
+
+@lru_cache
+def _required_methods_cached(est_scitype, is_est=True):
+    """Return required method names for est_scitype, as tuple - cached."""
+    return tuple(_list_required_methods(est_scitype, is_est=is_est))
+
+
+@lru_cache
+def _base_class_lookup_cached():
+    """Return get_base_class_lookup() - cached.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    return get_base_class_lookup()
+
+
+def _scitype_by_class(obj):
+    """Determine scitype string of class or object obj, cached by class if possible.
+
+    scitype is determined by tags, so instances with dynamic tags are not cached.
+    """
+    if _has_dynamic_tags(obj):
+        return scitype(obj)
+    obj_cls = obj if isclass(obj) else type(obj)
+    return _scitype_cached(obj_cls)
+
+
+# cache for _has_capability_by_class, keys are (class, isclass, method name)
+_HAS_CAPABILITY_CACHE = dict()
+
+
+def _has_capability_by_class(obj, method):
+    """Check whether obj has capability of method, cached by class if possible.
+
+    Capability is determined by tags, so instances with dynamic tags are not cached.
+    The cache key contains whether obj is a class, since _has_capability
+    can differ for classes and their instances.
+    """
+    if _has_dynamic_tags(obj):
+        return _has_capability(obj, method)
+    is_cls = isclass(obj)
+    key = (obj if is_cls else type(obj), is_cls, method)
+    if key not in _HAS_CAPABILITY_CACHE:
+        _HAS_CAPABILITY_CACHE[key] = _has_capability(obj, method)
+    return _HAS_CAPABILITY_CACHE[key]
+
+
+@lru_cache
+def _excluded_scenario_cached(test_name, scenario_cls):
+    """Check whether scenario class should be skipped in test_name - cached.
+
+    Default logic for BaseFixtureGenerator._excluded_scenario,
+    exclusion depends on test_name and class tags of scenario_cls only.
+    Scenarios without the "is_enabled" flag are already removed on retrieval,
+    in _retrieve_scenario_classes_cached.
+    """
+    # for forecasters tested in test_methods_do_not_change_state
+    #   if fh is not passed in fit, then this test would fail
+    #   since fh will be stored in predict through fh handling
+    #   as there are scenarios which pass it early and everything else is the same
+    #   we skip those scenarios
+    if test_name == "test_methods_do_not_change_state":
+        if not scenario_cls.get_class_tag("fh_passed_in_fit", True):
+            return True
+
+    return False
+
+
+# tests in which forecaster predict_proba and, without skpro, predict_var are skipped
+_TESTS_WITHOUT_FORECASTER_PROBA = frozenset(
+    [
+        "test_persistence_via_pickle",
+        "test_save_estimators_to_file",
+        "test_multiprocessing_idempotent",
+    ]
+)
+
+
+@lru_cache
+def _excluded_method_nsc_cached(test_name, est_scitype):
+    """Get frozenset of methods not to test in test_name, for est_scitype - cached.
+
+    Used in BaseFixtureGenerator._generate_method_nsc_arraylike,
+    so excluded methods are not generated as fixtures in the first place.
+    """
+    if test_name not in _TESTS_WITHOUT_FORECASTER_PROBA:
+        return frozenset()
+    if est_scitype != "forecaster":
+        return frozenset()
+    # predict_proba produces a skpro distribution, which cannot be pickled,
+    #   and for which no ready equality check is implemented
+    # predict_var etc require skpro for forecasters
+    if _SKPRO_AVAILABLE:
+        return frozenset(["predict_proba"])
+    return frozenset(["predict_proba", "predict_var"])
+
+
 class ValidProbaErrors:
     """Context manager, returns None on valid predict_proba or skpro exception."""
 
@@ -134,7 +480,7 @@ class BaseFixtureGenerator:
         ranges over estimator classes not excluded by EXCLUDE_ESTIMATORS, EXCLUDED_TESTS
         instances are generated by create_test_instance class method of estimator_class
     scenario: instance of TestScenario
-        ranges over all scenarios returned by retrieve_scenarios
+        ranges over all enabled scenarios returned by retrieve_scenarios
         applicable for estimator_class or estimator_instance
     method_nsc: string, name of estimator method
         ranges over all "predict"-like, non-state-changing methods
@@ -163,6 +509,13 @@ class BaseFixtureGenerator:
     #   warning: direct fixtures retain state changes within the same test
     indirect_fixtures = ["estimator_instance"]
 
+    def __init_subclass__(cls, **kwargs):
+        """Collect names of _generate_[variable] methods, once per class."""
+        super().__init_subclass__(**kwargs)
+        cls._generator_methods = tuple(
+            attr for attr in dir(cls) if attr.startswith("_generate_")
+        )
+
     def pytest_generate_tests(self, metafunc):
         """Test parameterization routine for pytest.
 
@@ -201,30 +554,19 @@ class BaseFixtureGenerator:
 
     def _all_estimators(self):
         """Retrieve list of all estimator classes of type self.estimator_type_filter."""
-        # TODO(fangelim): refactor this _all_estimators
-        # to make it possible to set custom tags to filter
-        # as class attributes, similar to `estimator_type_filter`
-        filter_tags = {"tests:skip_all": False}
-
-        est_list = all_estimators(
-            estimator_types=getattr(self, "estimator_type_filter", None),
-            return_names=False,
-            exclude_estimators=EXCLUDE_ESTIMATORS,
-            filter_tags=filter_tags,
-        )
-        # subsample estimators by OS & python version
-        # this ensures that only a 1/3 of estimators are tested for a given combination
-        # but all are tested on every OS at least once, and on every python version once
-        if MATRIXDESIGN:
-            est_list = subsample_by_version_os(est_list)
+        from sktime.tests import _config
 
-        # run_test_for_class selects the estimators to run
-        # based on whether they have changed, and whether they have all dependencies
-        # internally, uses the ONLY_CHANGED_MODULES flag,
-        # and checks the python env against python_dependencies tag
-        est_list = [est for est in est_list if run_test_for_class(est)]
+        estimator_type_filter = getattr(self, "estimator_type_filter", None)
+        if isinstance(estimator_type_filter, list):
+            estimator_type_filter = tuple(estimator_type_filter)
 
-        return est_list
+        est_list = _all_estimators_cached(
+            estimator_type_filter,
+            matrixdesign=_config.MATRIXDESIGN,
+            only_changed_modules=_config.ONLY_CHANGED_MODULES,
+        )
+        # copy the result to avoid modifying the cached result
+        return list(est_list)
 
     def generator_dict(self):
         """Return dict with methods _generate_[variable] collected in a dict.
@@ -239,11 +581,9 @@ class BaseFixtureGenerator:
                 named _generate_[variable](test_name: str, **kwargs)
             value at [variable] is a reference to _generate_[variable]
         """
-        gens = [attr for attr in dir(self) if attr.startswith("_generate_")]
-        vars = [gen.replace("_generate_", "") for gen in gens]
-
         generator_dict = dict()
-        for var, gen in zip(vars, gens):
+        for gen in self._generator_methods:
+            var = gen.replace("_generate_", "")
             generator_dict[var] = getattr(self, gen)
 
         return generator_dict
@@ -254,13 +594,8 @@ class BaseFixtureGenerator:
         # there are two conditions for exclusion:
         # 1. the estimator is excluded in the legacy EXCLUDED_TESTS list
         # 2. the excluded test appears in the "tests:skip_by_name" tag
-        cond1 = test_name in EXCLUDED_TESTS.get(est.__name__, [])
-        excl_tag = est.get_class_tag("tests:skip_by_name", [])
-        if excl_tag is None:
-            excl_tag = []
-        cond2 = test_name in excl_tag
-        excluded = cond1 or cond2
-        return excluded
+        # both are collected once per class, in _excluded_tests_cached
+        return test_name in _excluded_tests_cached(est)
 
     # the following functions define fixture generation logic for pytest_generate_tests
     # each function is of signature (test_name:str, **kwargs) -> List of fixtures
@@ -304,8 +639,10 @@ class BaseFixtureGenerator:
         estimator_instances_to_test = []
         estimator_instance_names = []
         # retrieve all estimator parameters if multiple, construct instances
+        # instances are created once per class and shared between tests,
+        #   this is safe since the estimator_instance fixture clones them
         for est in estimator_classes_to_test:
-            all_instances_of_est, instance_names = est.create_test_instances_and_names()
+            all_instances_of_est, instance_names = _create_test_instances_cached(est)
             estimator_instances_to_test += all_instances_of_est
             estimator_instance_names += instance_names
 
@@ -335,8 +672,17 @@ class BaseFixtureGenerator:
         else:
             return []
 
-        scenarios = retrieve_scenarios(obj)
-        scenarios = [s for s in scenarios if not self._excluded_scenario(test_name, s)]
+        # scenario classes are retrieved for the scitype of obj, this is cached,
+        #   scenarios are instantiated on every call, so tests do not share test data
+        #   applicability depends on tags of obj, so is checked for every obj
+        #   the cached, test specific exclusion is checked first, as it is cheaper
+        scenario_classes = _retrieve_scenario_classes_cached(_scitype_by_class(obj))
+        scenarios = [scen_cls() for scen_cls in scenario_classes]
+        scenarios = [
+            s
+            for s in scenarios
+            if not self._excluded_scenario(test_name, s) and s.is_applicable(obj)
+        ]
         scenario_names = [type(scen).__name__ for scen in scenarios]
 
         return scenarios, scenario_names
@@ -354,22 +700,7 @@ class BaseFixtureGenerator:
         -------
         bool, whether scenario should be skipped in test_name
         """
-        # for forecasters tested in test_methods_do_not_change_state
-        #   if fh is not passed in fit, then this test would fail
-        #   since fh will be stored in predict through fh handling
-        #   as there are scenarios which pass it early and everything else is the same
-        #   we skip those scenarios
-        if test_name == "test_methods_do_not_change_state":
-            if not scenario.get_tag("fh_passed_in_fit", True, raise_error=False):
-                return True
-
-        # this line excludes all scenarios that do not have "is_enabled" flag
-        #   we should slowly enable more scenarios for better coverage
-        # comment out to run the full test suite with new scenarios
-        if not scenario.get_tag("is_enabled", False, raise_error=False):
-            return True
-
-        return False
+        return _excluded_scenario_cached(test_name, type(scenario))
 
     def _generate_method_nsc(self, test_name, **kwargs):
         """Return estimator test scenario.
@@ -391,7 +722,7 @@ class BaseFixtureGenerator:
         nsc_list = NON_STATE_CHANGING_METHODS
 
         # subset to the methods that x has implemented
-        nsc_list = [x for x in nsc_list if _has_capability(obj, x)]
+        nsc_list = [x for x in nsc_list if _has_capability_by_class(obj, x)]
 
         return nsc_list
 
@@ -407,15 +738,30 @@ class BaseFixtureGenerator:
         method_nsc_list = self._generate_method_nsc(test_name=test_name, **kwargs)
 
         # subset to the arraylike ones to avoid copy-paste
-        nsc_list_arraylike = set(method_nsc_list).intersection(
-            NON_STATE_CHANGING_METHODS_ARRAYLIKE
-        )
-        return list(nsc_list_arraylike)
+        # order of method_nsc_list is retained, so that test ids are deterministic,
+        #   this is required for distributing tests via pytest-xdist
+        nsc_list_arraylike = [
+            x for x in method_nsc_list if x in NON_STATE_CHANGING_METHODS_ARRAYLIKE
+        ]
+
+        # remove methods excluded for the test and the estimator's scitype
+        # if method_nsc_list is not empty, an estimator is present in kwargs
+        if nsc_list_arraylike:
+            obj = kwargs.get("estimator_class", kwargs.get("estimator_instance"))
+            excluded = _excluded_method_nsc_cached(test_name, _scitype_by_class(obj))
+            nsc_list_arraylike = [x for x in nsc_list_arraylike if x not in excluded]
+
+        return nsc_list_arraylike
 
 
 class QuickTester:
     """Mixin class which adds the run_tests method to run tests on one estimator."""
 
+    def __init_subclass__(cls, **kwargs):
+        """Collect names of test methods, once per class."""
+        super().__init_subclass__(**kwargs)
+        cls._test_methods = tuple(attr for attr in dir(cls) if attr.startswith("test"))
+
     def run_tests(
         self,
         estimator,
@@ -525,13 +871,25 @@ class QuickTester:
             fixtures_to_exclude, var_name="fixtures_to_exclude"
         )
 
-        # retrieve tests from self
-        test_names = [attr for attr in dir(self) if attr.startswith("test")]
+        # fixture codes are looked up for every test-fixture combination in loop B,
+        #   so they are coerced to sets for constant time lookup
+        # fixture codes contain the test as substring until the first "["
+        if fixtures_to_run is not None:
+            fixtures_to_run = frozenset(fixtures_to_run)
+            tests_from_fixt = {fixt.partition("[")[0] for fixt in fixtures_to_run}
+        else:
+            tests_from_fixt = set()
+        if fixtures_to_exclude is not None:
+            fixtures_to_exclude = frozenset(fixtures_to_exclude)
+
+        # retrieve tests from self, these are collected once per class
+        test_names = self._test_methods
 
         # we override the generator_dict, by replacing it with temp_generator_dict:
         #  the only estimator (class or instance) is est, this is overridden
         #  the remaining fixtures are generated conditionally, without change
-        temp_generator_dict = deepcopy(self.generator_dict())
+        # generator_dict returns a new dict of bound methods, so no copy is needed
+        temp_generator_dict = self.generator_dict()
 
         if isclass(estimator):
             estimator_class = estimator
@@ -544,8 +902,12 @@ class QuickTester:
         def _generate_estimator_instance(test_name, **kwargs):
             return [estimator.clone()], [estimator_class.__name__]
 
+        # test instances are created once for all tests, not once per test
+        #   this is safe since args are copied before every test call, in loop B,
+        #   via _copy_fixtures
+        #   exceptions are not cached, so failures are raised again in every test
         def _generate_estimator_instance_cls(test_name, **kwargs):
-            return estimator_class.create_test_instances_and_names()
+            return _create_test_instances_cached(estimator_class)
 
         temp_generator_dict["estimator_class"] = _generate_estimator_class
 
@@ -556,23 +918,16 @@ class QuickTester:
         # override of generator_dict end, temp_generator_dict is now prepared
 
         # sub-setting to specific tests to run, if tests or fixtures were specified
-        if tests_to_run is None and fixtures_to_run is None:
-            test_names_subset = test_names
-        else:
-            test_names_subset = []
-            if tests_to_run is not None:
-                test_names_subset += list(set(test_names).intersection(tests_to_run))
-            if fixtures_to_run is not None:
-                # fixture codes contain the test as substring until the first "["
-                tests_from_fixt = [fixt.split("[")[0] for fixt in fixtures_to_run]
-                test_names_subset += list(set(test_names).intersection(tests_from_fixt))
-            test_names_subset = list(set(test_names_subset))
+        tests_wanted = set(test_names)
+        if tests_to_run is not None or fixtures_to_run is not None:
+            tests_wanted &= set(tests_to_run or ()).union(tests_from_fixt)
 
         # sub-setting by removing all tests from tests_to_exclude
         if tests_to_exclude is not None:
-            test_names_subset = list(
-                set(test_names_subset).difference(tests_to_exclude)
-            )
+            tests_wanted -= set(tests_to_exclude)
+
+        # tests are run in the order of test_names
+        test_names_subset = [test for test in test_names if test in tests_wanted]
 
         # the below loops run all the tests and collect the results here:
         results = dict()
@@ -598,7 +953,7 @@ class QuickTester:
             # if function is decorated with mark.parametrize, add variable settings
             # NOTE: currently this works only with single-variable mark.parametrize
             if hasattr(test_fun, "pytestmark"):
-                if len([x for x in test_fun.pytestmark if x.name == "parametrize"]) > 0:
+                if any(x.name == "parametrize" for x in test_fun.pytestmark):
                     # get the three lists from pytest
                     (
                         pytest_fixture_vars,
@@ -619,31 +974,39 @@ class QuickTester:
                 if int(verbose) > 0:
                     print(msg)  # noqa: T001, T201
 
+            # all fixtures of tests in tests_to_run are run,
+            #   for other tests only the fixtures in fixtures_to_run, if given
+            subset_fixtures = fixtures_to_run is not None and (
+                tests_to_run is None or test_name not in tests_to_run
+            )
+
             # loop B: for each test, we loop over all fixtures
             for params, fixt_name in zip(fixture_prod, fixture_names):
+                key = f"{test_name}[{fixt_name}]"
+
+                # we subset to test-fixtures to run by this, if given
+                #  key is identical to the pytest test-fixture string identifier
+                #  this is done first, to avoid constructing args for skipped fixtures
+                if subset_fixtures and key not in fixtures_to_run:
+                    continue
+                if fixtures_to_exclude is not None and key in fixtures_to_exclude:
+                    continue
+
                 # this is needed because pytest unwraps 1-tuples automatically
                 # but subsequent code assumes params is k-tuple, no matter what k is
                 if len(fixture_vars) == 1:
                     params = (params,)
-                key = f"{test_name}[{fixt_name}]"
                 args = dict(zip(fixture_vars, params))
 
                 for f in test_fun_vars:
                     if f not in args:
                         args[f] = self._make_builtin_fixture_equivalents(f)
 
-                # we subset to test-fixtures to run by this, if given
-                #  key is identical to the pytest test-fixture string identifier
-                if fixtures_to_run is not None and key not in fixtures_to_run:
-                    continue
-                if fixtures_to_exclude is not None and key in fixtures_to_exclude:
-                    continue
-
                 print_if_verbose(f"{key}")
 
                 try:
                     with StderrMute(active=verbose < 2), StdoutMute(active=verbose < 2):
-                        test_fun(**deepcopy(args))
+                        test_fun(**self._copy_fixtures(args))
                     results[key] = "PASSED"
                     print_if_verbose("PASSED")
                 except Skipped as err:
@@ -657,17 +1020,49 @@ class QuickTester:
 
         return results
 
+    @staticmethod
+    def _copy_fixtures(args):
+        """Copy fixture values in args dict, to avoid side effects between tests.
+
+        sktime objects are cloned, this is equivalent to the estimator_instance
+        fixture in pytest, and avoids deepcopy of the full object state.
+        Scenarios are deepcopied, since tests may read and pass scenario.args
+        directly, without the copy made in TestScenario.run.
+        All other values are deepcopied.
+
+        Parameters
+        ----------
+        args : dict, keys are fixture variable names, values are fixture values
+
+        Returns
+        -------
+        dict, same keys as args, values are copies of values in args
+        """
+        from sktime.utils._testing.scenarios import TestScenario
+
+        def _copy(obj):
+            # scenarios are checked first, as some scenarios are also sktime objects
+            if isinstance(obj, TestScenario):
+                return deepcopy(obj)
+            if isinstance(obj, BaseObject):
+                return obj.clone()
+            return deepcopy(obj)
+
+        return {key: _copy(value) for key, value in args.items()}
+
     @staticmethod
     def _check_None_str_or_list_of_str(obj, var_name="obj"):
         """Check that obj is None, str, or list of str, and coerce to list of str."""
-        if obj is not None:
-            msg = f"{var_name} must be None, str, or list of str"
-            if isinstance(obj, str):
-                obj = [obj]
-            if not isinstance(obj, list):
-                raise ValueError(msg)
-            if not np.all([isinstance(x, str) for x in obj]):
-                raise ValueError(msg)
+        if obj is None:
+            return obj
+        # str is the most common case, coerced to list without further checks
+        if isinstance(obj, str):
+            return [obj]
+        msg = f"{var_name} must be None, str, or list of str"
+        if not isinstance(obj, list):
+            raise ValueError(msg)
+        if not all(isinstance(x, str) for x in obj):
+            raise ValueError(msg)
         return obj
 
     # todo: surely there is a pytest method that can be called instead of this?
@@ -705,7 +1100,8 @@ class QuickTester:
 
         pytest_fixture_vars = [x.args[0] for x in marks]
         pytest_fixt_raw = [x.args[1] for x in marks]
-        pytest_fixt_list = product(*pytest_fixt_raw)
+        # materialized as list, to return the list of tuples stated in the docstring
+        pytest_fixt_list = list(product(*pytest_fixt_raw))
         pytest_fixt_names_raw = [get_id(x) for x in marks]
         pytest_fixt_names = product(*pytest_fixt_names_raw)
         pytest_fixt_names = ["-".join(x) for x in pytest_fixt_names]
@@ -721,7 +1117,11 @@ class QuickTester:
         pytest_fixture_prod,
         pytest_fixture_names,
     ):
-        """Compute products of two sets of fixture vars, values, names."""
+        """Compute products of two sets of fixture vars, values, names.
+
+        Fixture values and names are returned as iterators, to be consumed once,
+        so the products are not materialized in memory.
+        """
         from itertools import product
 
         # product of fixture variable names = concatenation
@@ -730,15 +1130,16 @@ class QuickTester:
         # this is needed because pytest unwraps 1-tuples automatically
         # but subsequent code assumes params is k-tuple, no matter what k is
         if len(fixture_vars) == 1:
-            fixture_prod = [(x,) for x in fixture_prod]
+            fixture_prod = ((x,) for x in fixture_prod)
 
         # product of fixture products = Cartesian product plus append tuples
-        fixture_prod_return = product(fixture_prod, pytest_fixture_prod)
-        fixture_prod_return = [sum(x, ()) for x in fixture_prod_return]
+        fixture_prod_return = (
+            (*a, *b) for a, b in product(fixture_prod, pytest_fixture_prod)
+        )
 
         # product of fixture names = Cartesian product plus concat
         fixture_names_return = product(fixture_names, pytest_fixture_names)
-        fixture_names_return = ["-".join(x) for x in fixture_names_return]
+        fixture_names_return = ("-".join(x) for x in fixture_names_return)
 
         return fixture_vars_return, fixture_prod_return, fixture_names_return
 
@@ -828,7 +1229,7 @@ class TestAllObjects(BaseFixtureGenerator, QuickTester):
 
     def test_get_test_params(self, estimator_class):
         """Check that get_test_params returns valid parameter sets."""
-        param_list = estimator_class.get_test_params()
+        param_list = _get_test_params_cached(estimator_class)
 
         assert isinstance(param_list, (list, dict)), (
             f"{estimator_class.__name__}.get_test_params must "
@@ -837,39 +1238,27 @@ class TestAllObjects(BaseFixtureGenerator, QuickTester):
         )
         if isinstance(param_list, dict):
             param_list = [param_list]
-        msg = (
+        # messages are formatted in the assert, i.e., only on failure
+        assert all(isinstance(x, dict) for x in param_list), (
             f"{estimator_class.__name__}.get_test_params must "
             "return list of dict or dict, "
             f"found {param_list}"
         )
-        assert all(isinstance(x, dict) for x in param_list), msg
-
-        def _coerce_to_list_of_str(obj):
-            if isinstance(obj, str):
-                return obj
-            elif isinstance(obj, list):
-                return obj
-            else:
-                return []
-
-        reserved_param_names = estimator_class.get_class_tag(
-            "reserved_params", tag_value_default=None
-        )
-        reserved_param_names = _coerce_to_list_of_str(reserved_param_names)
 
-        param_names = estimator_class.get_param_names()
+        param_names = frozenset(_get_param_names_cached(estimator_class))
 
-        key_list = [x.keys() for x in param_list]
+        # short-circuiting check first, the full list is computed only on failure
+        if not all(x.keys() <= param_names for x in param_list):
+            notfound_errs = [set(x).difference(param_names) for x in param_list]
+            notfound_errs = [x for x in notfound_errs if len(x) > 0]
 
-        notfound_errs = [set(x).difference(param_names) for x in key_list]
-        notfound_errs = [x for x in notfound_errs if len(x) > 0]
-
-        assert len(notfound_errs) == 0, (
-            f"{estimator_class.__name__}.get_test_params return dict keys "
-            f"must be valid parameter names of {estimator_class.__name__}, "
-            "i.e., names of arguments of __init__, "
-            f"but found some parameters that are not __init__ args: {notfound_errs}"
-        )
+            raise AssertionError(
+                f"{estimator_class.__name__}.get_test_params return dict keys "
+                f"must be valid parameter names of {estimator_class.__name__}, "
+                "i.e., names of arguments of __init__, "
+                "but found some parameters that are not __init__ args: "
+                f"{notfound_errs}"
+            )
 
     def test_get_test_params_coverage(self, estimator_class):
         """Check that get_test_params has good test coverage.
@@ -878,32 +1267,18 @@ class TestAllObjects(BaseFixtureGenerator, QuickTester):
 
         * get_test_params returns at least two test parameter sets
         """
-        param_list = estimator_class.get_test_params()
+        param_list = _get_test_params_cached(estimator_class)
 
         if isinstance(param_list, dict):
             param_list = [param_list]
 
-        def _coerce_to_list_of_str(obj):
-            if isinstance(obj, str):
-                return obj
-            elif isinstance(obj, list):
-                return obj
-            else:
-                return []
-
-        reserved_param_names = estimator_class.get_class_tag(
-            "reserved_params", tag_value_default=None
-        )
-        reserved_param_names = _coerce_to_list_of_str(reserved_param_names)
-        reserved_set = set(reserved_param_names)
-
-        param_names = estimator_class.get_param_names()
-        unreserved_param_names = set(param_names).difference(reserved_set)
+        unreserved_param_names = _unreserved_param_names_cached(estimator_class)
 
         # commenting out "no reserved params in test params for now"
         # probably cannot ask for that, e.g., index/columns in BaseDistribution
 
         # key_list = [x.keys() for x in param_list]
+        # reserved_set = _reserved_params_cached(estimator_class)
 
         # reserved_errs = [set(x).intersection(reserved_set) for x in key_list]
         # reserved_errs = [x for x in reserved_errs if len(x) > 0]
@@ -952,12 +1327,12 @@ class TestAllObjects(BaseFixtureGenerator, QuickTester):
             f"found {type(names)}"
         )
 
-        assert np.all([isinstance(est, estimator_class) for est in estimators]), (
+        assert all(isinstance(est, estimator_class) for est in estimators), (
             "list elements of first return returned by create_test_instances_and_names "
             "all must be an instance of the class"
         )
 
-        assert np.all([isinstance(name, str) for name in names]), (
+        assert all(isinstance(name, str) for name in names), (
             "list elements of second return returned by create_test_instances_and_names"
             " all must be strings"
         )
@@ -983,9 +1358,7 @@ class TestAllObjects(BaseFixtureGenerator, QuickTester):
             )
             assert isinstance(tags, dict), msg
             assert len(tags) > 0, f"_tags dict of class {estimator_class} is empty"
-            invalid_tags = [
-                tag for tag in tags.keys() if tag not in VALID_ESTIMATOR_TAGS
-            ]
+            invalid_tags = sorted(tags.keys() - _VALID_ESTIMATOR_TAGS_SET)
             assert len(invalid_tags) == 0, (
                 f"_tags of {estimator_class} contains invalid tags: {invalid_tags}. "
                 "For a list of valid tags, see registry.all_tags, or registry._tags. "
@@ -1015,7 +1388,7 @@ class TestAllObjects(BaseFixtureGenerator, QuickTester):
             estimator_class, force_single_scitype=False, coerce_to_list=True
         )
 
-        class_lookup = get_base_class_lookup()
+        class_lookup = _base_class_lookup_cached()
 
         for est_scitype in est_scitypes:
             if est_scitype in class_lookup:
@@ -1037,8 +1410,8 @@ class TestAllObjects(BaseFixtureGenerator, QuickTester):
         if issubclass(estimator_class, BaseEstimator):
             assert isinstance(estimator.is_fitted, property)
 
-        est_scitype = scitype(estimator_class)
-        required_methods = _list_required_methods(est_scitype, is_est=is_est)
+        est_scitype = _scitype_cached(estimator_class)
+        required_methods = _required_methods_cached(est_scitype, is_est=is_est)
 
         for attr in required_methods:
             assert hasattr(estimator, attr), (
@@ -1050,19 +1423,20 @@ class TestAllObjects(BaseFixtureGenerator, QuickTester):
         if hasattr(estimator, "predict_proba"):
             assert hasattr(estimator, "predict")
 
-    def test_no_cross_test_side_effects_part1(self, estimator_instance):
-        """Test that there are no side effects across tests, through estimator state."""
-        estimator_instance.test__attr = 42
+    @pytest.mark.parametrize("a", [True, 42])
+    def test_no_between_test_case_side_effects(self, estimator_instance, a):
+        """Test that there are no side effects across instances of the same test.
 
-    def test_no_cross_test_side_effects_part2(self, estimator_instance):
-        """Test that there are no side effects across tests, through estimator state."""
+        The parametrization over a ensures that every estimator instance
+        is used in more than one case of this test.
+        Also sets the attribute checked in test_no_cross_test_side_effects.
+        """
         assert not hasattr(estimator_instance, "test__attr")
+        estimator_instance.test__attr = 42
 
-    @pytest.mark.parametrize("a", [True, 42])
-    def test_no_between_test_case_side_effects(self, estimator_instance, scenario, a):
-        """Test that there are no side effects across instances of the same test."""
+    def test_no_cross_test_side_effects(self, estimator_instance):
+        """Test that there are no side effects across tests, through estimator state."""
         assert not hasattr(estimator_instance, "test__attr")
-        estimator_instance.test__attr = 42
 
     def test_get_params(self, estimator_instance):
         """Check that get_params works correctly."""
@@ -1075,7 +1449,11 @@ class TestAllObjects(BaseFixtureGenerator, QuickTester):
         shallow_params = e.get_params(deep=False)
         deep_params = e.get_params(deep=True)
 
-        assert all(item in deep_params.items() for item in shallow_params.items())
+        # dict items views compare as sets, subset check uses key lookups in deep_params
+        assert shallow_params.items() <= deep_params.items(), (
+            f"get_params(deep=False) of {type(estimator).__name__} must be a subset "
+            "of get_params(deep=True)"
+        )
 
     def test_set_params(self, estimator_instance):
         """Check that set_params works correctly."""
@@ -1085,14 +1463,16 @@ class TestAllObjects(BaseFixtureGenerator, QuickTester):
         msg = f"set_params of {type(estimator).__name__} does not return self"
         assert estimator.set_params(**params) is estimator, msg
 
-        is_equal, equals_msg = deep_equals(
-            estimator.get_params(), params, return_msg=True
-        )
-        msg = (
-            f"get_params result of {type(estimator).__name__} (x) does not match "
-            f"what was passed to set_params (y). Reason for discrepancy: {equals_msg}"
-        )
-        assert is_equal, msg
+        # deep_equals is only called if cheap comparison does not confirm equality
+        params_after = estimator.get_params()
+        if not _fast_dict_equal(params_after, params):
+            is_equal, equals_msg = deep_equals(params_after, params, return_msg=True)
+            msg = (
+                f"get_params result of {type(estimator).__name__} (x) does not match "
+                "what was passed to set_params (y). "
+                f"Reason for discrepancy: {equals_msg}"
+            )
+            assert is_equal, msg
 
     def test_set_params_sklearn(self, estimator_class):
         """Check that set_params works correctly, mirrors sklearn check_set_params.
@@ -1102,38 +1482,41 @@ class TestAllObjects(BaseFixtureGenerator, QuickTester):
         which play along with the __init__ content.
         """
         estimator = estimator_class.create_test_instance()
-        test_params = estimator_class.get_test_params()
+        # deepcopy, since parameter values are passed to set_params below
+        test_params = deepcopy(_get_test_params_cached(estimator_class))
         if not isinstance(test_params, list):
             test_params = [test_params]
 
-        reserved_params = estimator_class.get_class_tag(
-            "reserved_params", tag_value_default=[]
-        )
+        # reserved_params is a frozenset, so membership checks are O(1)
+        reserved_params = _reserved_params_cached(estimator_class)
+
+        def unreserved(params):
+            return {p: v for p, v in params.items() if p not in reserved_params}
 
         for params in test_params:
             # we construct the full parameter set for params
             # params may only have parameters that are deviating from defaults
             # in order to set non-default parameters back to defaults
-            params_full = estimator_class.get_param_defaults()
+            params_full = deepcopy(_get_param_defaults_cached(estimator_class))
             params_full.update(params)
 
             msg = f"set_params of {estimator_class.__name__} does not return self"
             est_after_set = estimator.set_params(**params_full)
             assert est_after_set is estimator, msg
 
-            def unreserved(params):
-                return {p: v for p, v in params.items() if p not in reserved_params}
-
-            est_params = estimator.get_params(deep=False)
-            is_equal, equals_msg = deep_equals(
-                unreserved(est_params), unreserved(params_full), return_msg=True
-            )
-            msg = (
-                f"get_params result of {estimator_class.__name__} (x) does not match "
-                f"what was passed to set_params (y). "
-                f"Reason for discrepancy: {equals_msg}"
-            )
-            assert is_equal, msg
+            est_params = unreserved(estimator.get_params(deep=False))
+            params_full = unreserved(params_full)
+            # deep_equals is only called if cheap comparison does not confirm equality
+            if not _fast_dict_equal(est_params, params_full):
+                is_equal, equals_msg = deep_equals(
+                    est_params, params_full, return_msg=True
+                )
+                msg = (
+                    f"get_params result of {estimator_class.__name__} (x) does not "
+                    "match what was passed to set_params (y). "
+                    f"Reason for discrepancy: {equals_msg}"
+                )
+                assert is_equal, msg
 
     def test_clone(self, estimator_instance):
         """Check that clone method does not raise exceptions and results in a clone.
@@ -1150,13 +1533,10 @@ class TestAllObjects(BaseFixtureGenerator, QuickTester):
             assert not est_clone.is_fitted
 
     def test_repr(self, estimator_instance):
-        """Check that __repr__ call to instance does not raise exceptions."""
+        """Check that __repr__ and _repr_html_ calls to instance do not raise."""
         estimator = estimator_instance
         repr(estimator)
-
-    def test_repr_html(self, estimator_instance):
-        """Check that _repr_html_ call to instance does not raise exceptions."""
-        estimator_instance._repr_html_()
+        estimator._repr_html_()
 
     def test_constructor(self, estimator_class):
         """Check that the constructor has sklearn compatible signature and behaviour.
@@ -1175,15 +1555,19 @@ class TestAllObjects(BaseFixtureGenerator, QuickTester):
             (other type parameters should be None, default handling should be by writing
             the default to attribute of a different name, e.g., my_param_ not my_param)
         """
+        varkw, _, _ = _init_signature_cached(estimator_class)
         msg = "constructor __init__ should have no varargs"
-        assert getfullargspec(estimator_class.__init__).varkw is None, msg
+        assert varkw is None, msg
 
         estimator = estimator_class.create_test_instance()
         assert isinstance(estimator, estimator_class)
 
+        # signature of __init__ is retrieved for type(estimator), not estimator_class,
+        #   these can differ, e.g., for placeholder records
+        _, init_args, init_params = _init_signature_cached(type(estimator))
+
         # Ensure that each parameter is set in init
-        init_params = _get_args(type(estimator).__init__)
-        invalid_attr = set(init_params) - set(vars(estimator)) - {"self"}
+        invalid_attr = set(init_args) - set(vars(estimator)) - {"self"}
         assert not invalid_attr, (
             "Estimator %s should store all parameters"
             " as an attribute during init. Did not find "
@@ -1192,39 +1576,18 @@ class TestAllObjects(BaseFixtureGenerator, QuickTester):
 
         # Ensure that init does nothing but set parameters
         # No logic/interaction with other parameters
-        def param_filter(p):
-            """Identify hyper parameters of an estimator."""
-            return p.name != "self" and p.kind not in [p.VAR_KEYWORD, p.VAR_POSITIONAL]
-
-        init_params = [
-            p
-            for p in signature(estimator.__init__).parameters.values()
-            if param_filter(p)
-        ]
-
         params = estimator.get_params()
 
-        test_params = estimator_class.get_test_params()
+        test_params = _get_test_params_cached(estimator_class)
         if isinstance(test_params, list):
             test_params = test_params[0]
         test_params = test_params.keys()
 
         init_params = [param for param in init_params if param.name not in test_params]
 
-        allowed_param_types = [
-            str,
-            int,
-            float,
-            bool,
-            tuple,
-            type(None),
-            np.float64,
-            types.FunctionType,
-        ]
-        if _check_soft_dependencies("joblib", severity="none"):
-            from joblib import Memory
+        reserved_params = _reserved_params_cached(estimator_class)
 
-            allowed_param_types += [Memory]
+        allowed_param_types = _allowed_param_types_cached()
 
         for param in init_params:
             assert param.default != param.empty, (
@@ -1236,7 +1599,6 @@ class TestAllObjects(BaseFixtureGenerator, QuickTester):
             else:
                 assert type(param.default) in allowed_param_types
 
-            reserved_params = estimator_class.get_class_tag("reserved_params", [])
             if param.name not in reserved_params:
                 param_value = params[param.name]
                 if isinstance(param_value, np.ndarray):
@@ -1251,13 +1613,13 @@ class TestAllObjects(BaseFixtureGenerator, QuickTester):
 
     def test_valid_estimator_class_tags(self, estimator_class):
         """Check that Estimator class tags are in VALID_ESTIMATOR_TAGS."""
-        for tag in estimator_class.get_class_tags().keys():
-            msg = (
-                f"{estimator_class} has invalid tag: {tag!r} - "
-                "please check for spelling mistakes and if the tag exists "
-                "in the sktime API reference, or in registry.all_tags."
-            )
-            assert tag in VALID_ESTIMATOR_TAGS, msg
+        tags = estimator_class.get_class_tags().keys()
+        invalid_tags = sorted(tags - _VALID_ESTIMATOR_TAGS_SET)
+        assert len(invalid_tags) == 0, (
+            f"{estimator_class} has invalid tags: {invalid_tags} - "
+            "please check for spelling mistakes and if the tags exist "
+            "in the sktime API reference, or in registry.all_tags."
+        )
 
         from sktime.base._base import TagAliaserMixin
 
@@ -1274,13 +1636,13 @@ class TestAllObjects(BaseFixtureGenerator, QuickTester):
 
     def test_valid_estimator_tags(self, estimator_instance):
         """Check that Estimator tags are in VALID_ESTIMATOR_TAGS."""
-        for tag in estimator_instance.get_tags().keys():
-            msg = (
-                f"{estimator_instance} has invalid tag: {tag!r} - "
-                "please check for spelling mistakes and if the tag exists "
-                "in the sktime API reference, or in registry.all_tags."
-            )
-            assert tag in VALID_ESTIMATOR_TAGS, msg
+        tags = estimator_instance.get_tags().keys()
+        invalid_tags = sorted(tags - _VALID_ESTIMATOR_TAGS_SET)
+        assert len(invalid_tags) == 0, (
+            f"{estimator_instance} has invalid tags: {invalid_tags} - "
+            "please check for spelling mistakes and if the tags exist "
+            "in the sktime API reference, or in registry.all_tags."
+        )
 
         from sktime.base._base import TagAliaserMixin
 
@@ -1309,7 +1671,8 @@ class TestAllObjects(BaseFixtureGenerator, QuickTester):
             )
 
         # random_state tag should be set iff the parameter exists in the signature
-        assert random_state == ("random_state" in estimator_class.get_param_names()), (
+        param_names = _get_param_names_cached(estimator_class)
+        assert random_state == ("random_state" in param_names), (
             f"{estimator_class.__name__} must set "
             "'capability:random_state' tag to True, if and only if the "
             "random_state parameter exists in the estimator signature"
@@ -1336,7 +1699,7 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
     """Package level tests for all sktime estimators, i.e., objects with fit."""
 
     def test_fit_updates_state(self, estimator_instance, scenario):
-        """Check fit/update state change."""
+        """Check fit/update state change, and that fit returns self."""
         # Check that fit updates the is-fitted states
         attrs = ["_is_fitted", "is_fitted"]
 
@@ -1359,19 +1722,16 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
 
         fitted_estimator = scenario.run(estimator_instance, method_sequence=["fit"])
 
+        assert fitted_estimator is estimator_instance, (
+            f"Estimator: {estimator_instance} does not return self when calling fit"
+        )
+
         # Check is_fitted attributes are updated correctly to True after calling fit
         for attr in attrs:
             assert getattr(fitted_estimator, attr), (
                 f"Estimator: {estimator} does not update attribute: {attr} during fit"
             )
 
-    def test_fit_returns_self(self, estimator_instance, scenario):
-        """Check that fit returns self."""
-        fit_return = scenario.run(estimator_instance, method_sequence=["fit"])
-        assert fit_return is estimator_instance, (
-            f"Estimator: {estimator_instance} does not return self when calling fit"
-        )
-
     def test_raises_not_fitted_error(self, estimator_instance, scenario, method_nsc):
         """Check exception raised for non-fit method calls to unfitted estimators.
 
@@ -1385,6 +1745,11 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
         ------
         Exception if NotFittedError is not raised by non-state changing method
         """
+        from sktime.dists_kernels.base import (
+            BasePairwiseTransformer,
+            BasePairwiseTransformerPanel,
+        )
+
         # pairwise transformers are exempted from this test, since they have no fitting
         PWTRAFOS = (BasePairwiseTransformer, BasePairwiseTransformerPanel)
         excepted = isinstance(estimator_instance, PWTRAFOS)
@@ -1397,6 +1762,8 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
 
     def test_fit_idempotent(self, estimator_instance, scenario, method_nsc_arraylike):
         """Check that calling fit twice is equivalent to calling it once."""
+        from sktime.forecasting.base import BaseForecaster
+
         estimator = estimator_instance
 
         random_tag = estimator.get_tag("property:randomness")
@@ -1440,17 +1807,17 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
         set_random_state(estimator)
 
         # run fit plus method_nsc a second time
-        results_2nd = scenario.run(
+        # only the method output is compared and nothing runs after this call,
+        #   so there is no need to return or deepcopy the refitted estimator
+        result_2nd = scenario.run(
             estimator,
             method_sequence=["fit", method_nsc_arraylike],
-            return_all=True,
-            deepcopy_return=True,
         )
 
         # check results are equal
         _assert_array_almost_equal(
             results[1],
-            results_2nd[1],
+            result_2nd,
             # err_msg=f"Idempotency check failed for method {method}",
         )
 
@@ -1459,16 +1826,33 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
         estimator = estimator_instance
         set_random_state(estimator)
 
-        # Make a physical copy of the original estimator parameters before fitting.
+        # Snapshot the original estimator parameters before fitting.
+        # joblib.hash has problems with pandas objects, so these are copied,
+        #   for all other parameters only the joblib.hash checksum is stored
         params = estimator.get_params()
-        original_params = deepcopy(params)
+        joblib_hash = _joblib_hash()
+        original_snapshot = {}
+        for param_name, original_value in params.items():
+            if isinstance(original_value, (pd.DataFrame, pd.Series)):
+                original_snapshot[param_name] = deepcopy(original_value)
+            elif joblib_hash is not None:
+                original_snapshot[param_name] = joblib_hash(original_value)
 
         # Fit the model
         fitted_est = scenario.run(estimator_instance, method_sequence=["fit"])
 
+        def _msg(param_name, new_value, original_value=None):
+            msg = (
+                f"Estimator {type(estimator).__name__} should not change or mutate "
+                f"the parameter {param_name} during fit, value after fit: {new_value}"
+            )
+            if original_value is not None:
+                msg += f", value before fit: {original_value}"
+            return msg
+
         # Compare the state of the model parameters with the original parameters
         new_params = fitted_est.get_params()
-        for param_name, original_value in original_params.items():
+        for param_name, original in original_snapshot.items():
             new_value = new_params[param_name]
 
             # We should never change or mutate the internal state of input
@@ -1477,18 +1861,13 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
             # The only exception to this rule of immutable constructor parameters
             # is possible RandomState instance but in this check we explicitly
             # fixed the random_state params recursively to be integer seeds.
-            msg = (
-                "Estimator %s should not change or mutate "
-                "the parameter %s from %s to %s during fit."
-                % (estimator.__class__.__name__, param_name, original_value, new_value)
-            )
-            # joblib.hash has problems with pandas objects, so we use deep_equals then
-            if isinstance(original_value, (pd.DataFrame, pd.Series)):
-                assert deep_equals(new_value, original_value), msg
-            elif _check_soft_dependencies("joblib", severity="none"):
-                from joblib import hash
-
-                assert hash(new_value) == hash(original_value), msg
+            # the message is only formatted on failure, as str of params can be slow
+            if isinstance(original, (pd.DataFrame, pd.Series)):
+                assert deep_equals(new_value, original), _msg(
+                    param_name, new_value, original
+                )
+            else:
+                assert joblib_hash(new_value) == original, _msg(param_name, new_value)
 
     def test_non_state_changing_method_contract(
         self, estimator_instance, scenario, method_nsc
@@ -1512,22 +1891,35 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
 
         # skip test if vectorization would be necessary and method predict_proba
         # this is since vectorization is not implemented for predict_proba
+        # the method is called only once, the output is used in the checks below
         if method_nsc in ["predict_proba", "predict_var"]:
             with ValidProbaErrors() as handler:
-                scenario.run(estimator, method_sequence=[method_nsc])
+                output = scenario.run(estimator, method_sequence=[method_nsc])
             if handler.skipped:
                 return None
+        else:
+            output = scenario.run(estimator, method_sequence=[method_nsc])
 
         # dict_after = dictionary of estimator after predict and fit
-        output = scenario.run(estimator, method_sequence=[method_nsc])
         dict_after = estimator.__dict__
 
-        is_equal, msg = deep_equals(dict_after, dict_before, return_msg=True)
-        assert is_equal, (
-            f"Estimator: {type(estimator).__name__} changes __dict__ "
-            f"during {method_nsc}, "
-            f"reason/location of discrepancy (x=after, y=before): {msg}"
-        )
+        # deep_equals is only called if cheap comparison does not confirm equality,
+        #   and if keys are equal, only on values not confirmed equal by _fast_equal
+        if not _fast_dict_equal(dict_after, dict_before):
+            if dict_after.keys() == dict_before.keys():
+                diff_keys = [
+                    key
+                    for key, value in dict_after.items()
+                    if not _fast_equal(value, dict_before[key])
+                ]
+                dict_after = {key: dict_after[key] for key in diff_keys}
+                dict_before = {key: dict_before[key] for key in diff_keys}
+            is_equal, msg = deep_equals(dict_after, dict_before, return_msg=True)
+            assert is_equal, (
+                f"Estimator: {type(estimator).__name__} changes __dict__ "
+                f"during {method_nsc}, "
+                f"reason/location of discrepancy (x=after, y=before): {msg}"
+            )
 
         # once there are more methods, this may have to be factored out
         # for now, there is only get_fitted_params and we test here to avoid fit calls
@@ -1571,16 +1963,20 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
 
         # skip test if vectorization would be necessary and method predict_proba
         # this is since vectorization is not implemented for predict_proba
+        # the method is called only once, the args are used in the checks below
         if method_nsc in ["predict_proba", "predict_var"]:
             with ValidProbaErrors() as handler:
-                scenario.run(estimator, method_sequence=[method_nsc])
+                _, args_after = scenario.run(
+                    estimator, method_sequence=[method_nsc], return_args=True
+                )
             if handler.skipped:
                 return None
+        else:
+            _, args_after = scenario.run(
+                estimator, method_sequence=[method_nsc], return_args=True
+            )
 
-        # Fit the model, get args before and after
-        _, args_after = scenario.run(
-            estimator, method_sequence=[method_nsc], return_args=True
-        )
+        # get args of method_nsc before and after
         method_args_after = args_after[0]
         method_args_before = scenario.get_args(method_nsc, estimator)
 
@@ -1592,28 +1988,23 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
         self, estimator_instance, scenario, method_nsc_arraylike
     ):
         """Check that we can pickle all estimators."""
+        from sktime.base import load
+        from sktime.classification.deep_learning.base import BaseDeepClassifier
+        from sktime.regression.deep_learning.base import BaseDeepRegressor
+
         method_nsc = method_nsc_arraylike
         estimator = estimator_instance
-        is_forecaster = scitype(estimator) == "forecaster"
-
-        # escape predict_proba for forecasters, skpro distributions cannot be pickled
-        if is_forecaster and method_nsc == "predict_proba":
-            return None
-
-        # escape predict_var for forecasters if skpro is not available
-        skpro_available = _check_soft_dependencies("skpro", severity="none")
-        if is_forecaster and method_nsc == "predict_var" and not skpro_available:
-            return None
 
         # escape Deep estimators if soft-dep `h5py` isn't installed
-        if isinstance(
-            estimator_instance, (BaseDeepClassifier, BaseDeepRegressor)
-        ) and not _check_soft_dependencies("h5py", severity="warning"):
+        if (
+            isinstance(estimator_instance, (BaseDeepClassifier, BaseDeepRegressor))
+            and not _H5PY_AVAILABLE
+        ):
             return None
 
         set_random_state(estimator)
-        # Fit the model, get args before and after
-        scenario.run(estimator, method_sequence=["fit"], return_args=True)
+        # Fit the model
+        scenario.run(estimator, method_sequence=["fit"])
 
         # Generate results before pickling
         vanilla_result = scenario.run(estimator, method_sequence=[method_nsc])
@@ -1641,22 +2032,14 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
         self, estimator_instance, scenario, method_nsc_arraylike
     ):
         """Check if saved estimators onto disk can be loaded correctly."""
+        from sktime.base import load
+
         method_nsc = method_nsc_arraylike
         estimator = estimator_instance
-        is_forecaster = scitype(estimator) == "forecaster"
-
-        # escape predict_proba for forecasters, skpro distributions cannot be pickled
-        if is_forecaster and method_nsc == "predict_proba":
-            return None
-
-        # escape predict_var for forecasters if skpro is not available
-        skpro_available = _check_soft_dependencies("skpro", severity="none")
-        if is_forecaster and method_nsc == "predict_var" and not skpro_available:
-            return None
 
         set_random_state(estimator)
-        # Fit the model, get args before and after
-        scenario.run(estimator, method_sequence=["fit"], return_args=True)
+        # Fit the model
+        scenario.run(estimator, method_sequence=["fit"])
 
         # Generate results before saving
         vanilla_result = scenario.run(estimator, method_sequence=[method_nsc])
@@ -1690,6 +2073,12 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
         all CPUs. The test is not really necessary though, as we rely on joblib for
         parallelization and can trust that it works as expected.
         """
+        # test runs only if n_jobs is a parameter of the estimator
+        # checked first, since this is the most frequent exit,
+        #   and on the cached parameter names rather than a deep get_params
+        if "n_jobs" not in _get_param_names_cached(type(estimator_instance)):
+            return None
+
         # this test compares outputs from two runs, single process and multi-process
         # if the estimator cannot be derandomized, we cannot expect
         # identical outputs, so we skip the test
@@ -1699,26 +2088,12 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
             return None
 
         method_nsc = method_nsc_arraylike
-        params = estimator_instance.get_params()
-
-        # test runs only if n_jobs is a parameter of the estimator
-        if "n_jobs" not in params:
-            return None
-
-        # skip test for predict_proba
-        # this produces a BaseDistribution object, for which no ready
-        # equality check is implemented
-        is_forecaster = scitype(estimator_instance) == "forecaster"
-        if is_forecaster and method_nsc == "predict_proba":
-            return None
-        # escape predict_proba etc for forecasters if skpro is not available
-        skpro_available = _check_soft_dependencies("skpro", severity="none")
-        if is_forecaster and method_nsc == "predict_var" and not skpro_available:
-            return None
 
         # run on a single process
         # -----------------------
-        estimator = deepcopy(estimator_instance)
+        # estimator_instance is unfitted here, so clone constructs a fresh
+        #   instance from its parameters, without traversing any fitted state
+        estimator = estimator_instance.clone()
         estimator.set_params(n_jobs=1)
         set_random_state(estimator)
         result_single_process = scenario.run(
@@ -1727,7 +2102,8 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
 
         # run on multiple processes
         # -------------------------
-        estimator = deepcopy(estimator_instance)
+        # estimator_instance is not used after this, so no copy is needed
+        estimator = estimator_instance
         estimator.set_params(n_jobs=-1)
         set_random_state(estimator)
         result_multiple_process = scenario.run(
@@ -1742,6 +2118,9 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
 
     def test_dl_constructor_initializes_deeply(self, estimator_class):
         """Test DL estimators that they pass custom parameters to underlying Network."""
+        from sktime.classification.deep_learning.base import BaseDeepClassifier
+        from sktime.regression.deep_learning.base import BaseDeepRegressor
+
         estimator = estimator_class
 
         if not issubclass(estimator, (BaseDeepClassifier, BaseDeepRegressor)):
@@ -1750,7 +2129,8 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
         if not hasattr(estimator, "get_test_params"):
             return None
 
-        params = estimator.get_test_params()
+        # deepcopy, since parameter values are passed to the constructor below
+        params = deepcopy(_get_test_params_cached(estimator))
 
         if isinstance(params, list):
             params = params[0]
@@ -1764,9 +2144,13 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
 
         estimator = estimator(**params)
 
+        # attribute dicts of the estimator and its network, retrieved once
+        est_vars = vars(estimator)
+        net_vars = vars(estimator._network)
+
         for key, value in params.items():
-            assert vars(estimator)[key] == value
+            assert est_vars[key] == value
             # some keys are only relevant to the final model (eg: n_epochs)
             # skip them for the underlying network
-            if vars(estimator._network).get(key) is not None:
-                assert vars(estimator._network)[key] == value
+            if net_vars.get(key) is not None:
+                assert net_vars[key] == value
@@ -10,8 +10,6 @@ __all__ = ["create_conditional_fixtures_and_names"]
 from collections.abc import Callable
 from copy import deepcopy
 
-import numpy as np
-
 
 class FixtureGenerationError(Exception):
     """Raised when a fixture fails to generate."""
@@ -225,7 +223,7 @@ def _check_list_of_str(obj, name="obj"):
     ------
     TypeError if obj is not list of str
     """
-    if not isinstance(obj, list) or not np.all([isinstance(x, str) for x in obj]):
+    if not isinstance(obj, list) or not all(isinstance(x, str) for x in obj):
         raise TypeError(f"{name} must be a list of str")
     return obj
 
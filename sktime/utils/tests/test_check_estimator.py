@@ -116,6 +116,33 @@ def test_check_estimator_subset_tests():
     assert results_tests == expected_tests
 
 
+@pytest.mark.skipif(
+    not run_test_module_changed(["sktime.utils", "sktime.tests"])
+    and not run_test_for_class(ExponentTransformer),
+    reason="Run if check_estimator or TestAll classes have changed.",
+)
+def test_check_estimator_subset_tests_and_fixtures():
+    """Test that tests_to_run and fixtures_to_run together run the union."""
+    fixture_to_run = "test_repr[ExponentTransformer-1]"
+
+    results_clone = check_estimator(
+        ExponentTransformer, verbose=False, tests_to_run="test_clone"
+    )
+
+    results = check_estimator(
+        ExponentTransformer,
+        verbose=False,
+        tests_to_run="test_clone",
+        fixtures_to_run=fixture_to_run,
+    )
+
+    # all fixtures of test_clone are run, plus the single test_repr fixture
+    expected_keys = set(results_clone.keys()).union([fixture_to_run])
+
+    assert len(results_clone) > 1
+    assert set(results.keys()) == expected_keys
+
+
 @pytest.mark.skipif(
     not run_test_for_class(_get_test_names_for_obj),
     reason="run test only if softdeps are present and incrementally (if requested)",